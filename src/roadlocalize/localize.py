@@ -3,31 +3,179 @@ RoadLocalize - Internationalization & Localization for BlackRoad
 Multi-language support with translations, formatting, and locale management.
 """
 
+from contextvars import ContextVar, Token
 from dataclasses import dataclass, field
 from datetime import datetime, date
 from decimal import Decimal
-from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Union
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+import functools
+import itertools
 import json
 import logging
 import os
 import re
+import string as _string
+import sys
 import threading
 
+try:
+    import cachetools
+except ImportError:
+    cachetools = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+_PLACEHOLDER = re.compile(r'\{\{(\w+)\}\}')
+# A {{name}} placeholder or any other brace, which must be escaped
+_TEMPLATE_TOKEN = re.compile(r'\{\{(\w+)\}\}|([{}])')
+
+
+def _compile_template(text: str) -> Optional[str]:
+    """Compile {{name}} placeholders in text to str.format_map syntax.
+
+    Every other brace is escaped so it renders literally. Returns None when
+    a placeholder name is not an identifier, since format_map reads {0} as
+    a positional field; such text is interpolated with the regex instead.
+    """
+    if not all(name.isidentifier() for name in _PLACEHOLDER.findall(text)):
+        return None
+    return _TEMPLATE_TOKEN.sub(
+        lambda m: "{" + m.group(1) + "}" if m.group(1) else m.group(2) * 2,
+        text
+    )
+
+
+def _memoize(func: Callable, maxsize: int) -> Callable:
+    """Bounded memoizer: LFU via cachetools, else functools LRU.
+
+    LFU keeps the few hot keys of a skewed translate workload resident even
+    when one-off params churn through the cache. Unlike lru_cache it is not
+    thread-safe: every hit updates the key's use count, so hits need the
+    lock too. func never re-enters the cache, so a plain Lock will do.
+    """
+    if cachetools is None:
+        return functools.lru_cache(maxsize=maxsize)(func)
+    return cachetools.cached(
+        cachetools.LFUCache(maxsize=maxsize), lock=threading.Lock(), info=True
+    )(func)
+
+
+def _is_cacheable(params: Dict[str, Any]) -> bool:
+    """Only exact str/int values render the same whenever they compare equal.
+
+    1, 1.0 and True are equal dict keys but render differently, so anything
+    else (bool, float, Decimal, subclasses) bypasses the translate memo.
+    """
+    return all(type(value) is str or type(value) is int for value in params.values())
+
+
+def _split_template(text: str) -> Optional[Tuple[Tuple[str, Optional[str]], ...]]:
+    """Split a format_map template into (literal, field name) pairs.
+
+    Returns None when a field uses a format spec, conversion or attribute
+    access, which only format_map can render.
+    """
+    parts = []
+    for literal, name, spec, conversion in _string.Formatter().parse(text):
+        if name is not None and (spec or conversion or not name.isidentifier()):
+            return None
+        parts.append((literal, name))
+    return tuple(parts)
 
-class PluralForm(str, Enum):
-    """Plural form categories."""
-    ZERO = "zero"
-    ONE = "one"
-    TWO = "two"
-    FEW = "few"
-    MANY = "many"
-    OTHER = "other"
 
+class _SafeDict(dict):
+    """format_map mapping that leaves unknown placeholders untouched."""
 
-@dataclass
+    def __missing__(self, key: str) -> str:
+        return "{{" + key + "}}"
+
+
+# Plural form categories, interned since they are only used as dict keys
+PLURAL_ZERO, PLURAL_ONE, PLURAL_TWO, PLURAL_FEW, PLURAL_MANY, PLURAL_OTHER = map(
+    sys.intern, ("zero", "one", "two", "few", "many", "other")
+)
+
+
+class PluralForm:
+    """Plural form categories."""
+    ZERO = PLURAL_ZERO
+    ONE = PLURAL_ONE
+    TWO = PLURAL_TWO
+    FEW = PLURAL_FEW
+    MANY = PLURAL_MANY
+    OTHER = PLURAL_OTHER
+
+
+def _default_plural_fn(count: int) -> str:
+    """Default English-like plural rule."""
+    if count == 0:
+        return PLURAL_ZERO
+    elif count == 1:
+        return PLURAL_ONE
+    return PLURAL_OTHER
+
+
+# CLDR cardinal plural rules for integer counts, keyed by locale code or
+# language. Each entry is a Python expression over n = abs(count); it is
+# compiled into a straight-line function once per rule.
+_PLURAL_RULES: Dict[str, str] = {
+    "en": "'one' if n == 1 else 'other'",
+    "de": "'one' if n == 1 else 'other'",
+    "es": "'one' if n == 1 else 'other'",
+    "it": "'one' if n == 1 else 'other'",
+    "nl": "'one' if n == 1 else 'other'",
+    "pt-PT": "'one' if n == 1 else 'other'",
+    "pt": "'one' if n <= 1 else 'other'",
+    "fr": "'one' if n <= 1 else 'other'",
+    "ja": "'other'",
+    "ko": "'other'",
+    "zh": "'other'",
+    "ar": (
+        "'zero' if n == 0 else 'one' if n == 1 else 'two' if n == 2"
+        " else 'few' if 3 <= n % 100 <= 10 else 'many' if n % 100 >= 11"
+        " else 'other'"
+    ),
+    "ru": (
+        "'one' if n % 10 == 1 and n % 100 != 11"
+        " else 'few' if 2 <= n % 10 <= 4 and not 12 <= n % 100 <= 14"
+        " else 'many'"
+    ),
+    "uk": (
+        "'one' if n % 10 == 1 and n % 100 != 11"
+        " else 'few' if 2 <= n % 10 <= 4 and not 12 <= n % 100 <= 14"
+        " else 'many'"
+    ),
+    "pl": (
+        "'one' if n == 1"
+        " else 'few' if 2 <= n % 10 <= 4 and not 12 <= n % 100 <= 14"
+        " else 'many'"
+    ),
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_plural_rule(expression: str) -> Callable[[int], str]:
+    """Generate a plural function from a rule expression."""
+    namespace: Dict[str, Any] = {}
+    exec(f"def _plural_fn(n):\n    n = abs(n)\n    return {expression}\n", namespace)
+    return namespace["_plural_fn"]
+
+
+def _plural_fn_for(code: str) -> Callable[[int], str]:
+    """Get the plural function for a locale code, falling back to its language."""
+    expression = _PLURAL_RULES.get(code) or _PLURAL_RULES.get(code.split("-")[0])
+    if expression is None:
+        return _default_plural_fn
+    return _compile_plural_rule(expression)
+
+
+@dataclass(slots=True)
 class Locale:
     """A locale configuration."""
     code: str  # e.g., "en-US", "fr-FR"
@@ -40,7 +188,9 @@ class Locale:
     number_thousand: str = ","
     currency_symbol: str = "$"
     currency_position: str = "before"  # before or after
-    plural_rule: Optional[Callable[[int], PluralForm]] = None
+    plural_rule: Optional[Callable[[int], str]] = None
+    # Built-in rule for code, bound by add_locale; plural_rule takes precedence
+    _plural_fn: Optional[Callable[[int], str]] = field(default=None, init=False, repr=False, compare=False)
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -53,7 +203,7 @@ class Locale:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Translation:
     """A translation entry."""
     key: str
@@ -62,6 +212,12 @@ class Translation:
     plural_forms: Dict[str, str] = field(default_factory=dict)
     context: str = ""
     metadata: Dict[str, Any] = field(default_factory=dict)
+    # format_map forms of value and plural_forms, filled in by the store;
+    # None means interpolate the raw text with the regex
+    _template: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _plural_templates: Dict[str, Optional[str]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
 
 class TranslationStore:
@@ -70,7 +226,9 @@ class TranslationStore:
     def __init__(self):
         self.translations: Dict[str, Dict[str, Translation]] = {}  # locale -> key -> translation
         self.locales: Dict[str, Locale] = {}
-        self._lock = threading.Lock()
+        self._lock = threading.Lock()  # serializes writers only; readers never lock
+        self._version = 0  # bumped on every write so caches can invalidate
+        self._locales_version = 0  # bumped by add_locale only
         self._setup_default_locales()
 
     def _setup_default_locales(self):
@@ -133,73 +291,216 @@ class TranslationStore:
         ))
 
     def add_locale(self, locale: Locale) -> None:
+        locale._plural_fn = _plural_fn_for(locale.code)
         with self._lock:
-            self.locales[locale.code] = locale
+            self.locales = {**self.locales, locale.code: locale}
             if locale.code not in self.translations:
-                self.translations[locale.code] = {}
+                self.translations = {**self.translations, locale.code: {}}
+            self._version += 1
+            self._locales_version += 1
+
+    @property
+    def version(self) -> int:
+        """Counter bumped on every write, for callers that cache reads."""
+        return self._version
+
+    @property
+    def locales_version(self) -> int:
+        """Counter bumped by add_locale, for callers that cache per locale."""
+        return self._locales_version
 
     def get_locale(self, code: str) -> Optional[Locale]:
         return self.locales.get(code)
 
+    def _publish(self, updates: Dict[str, Dict[str, Translation]]) -> None:
+        """Merge updates into the per-locale dicts, then bump the version.
+
+        Known locales are updated in place, so filling a locale key by key
+        stays linear; readers only ever .get() single keys from them. The
+        small locale -> dict mapping is copied and swapped in only when a
+        new locale appears. Caller holds _lock.
+        """
+        new_locales = {}
+        for locale, entries in updates.items():
+            locale_translations = self.translations.get(locale)
+            if locale_translations is None:
+                new_locales[locale] = dict(entries)
+            else:
+                locale_translations.update(entries)
+        if new_locales:
+            self.translations = {**self.translations, **new_locales}
+        self._version += 1
+
+    @staticmethod
+    def _prepare(translation: Translation) -> Translation:
+        """Intern locale and key, and compile the value templates.
+
+        Every write path goes through here, so value and plural_forms keep
+        their {{name}} form while translate renders the compiled copies.
+        """
+        translation.locale = sys.intern(translation.locale)
+        translation.key = sys.intern(translation.key)
+        translation._template = _compile_template(translation.value)
+        translation._plural_templates = {
+            form: _compile_template(str(text))
+            for form, text in translation.plural_forms.items()
+        }
+        return translation
+
     def add_translation(self, translation: Translation) -> None:
+        """Add one translation.
+
+        Each write starts a fresh translate memo; prefer add_translations or
+        load_json for bulk loads.
+        """
+        translation = self._prepare(translation)
+        with self._lock:
+            self._publish({translation.locale: {translation.key: translation}})
+
+    def add_translations(self, translations: Iterable[Translation]) -> None:
+        """Add many translations in one swap under a single lock acquisition."""
+        updates: Dict[str, Dict[str, Translation]] = {}
+        for translation in map(self._prepare, translations):
+            updates.setdefault(translation.locale, {})[translation.key] = translation
+        if not updates:
+            return
         with self._lock:
-            if translation.locale not in self.translations:
-                self.translations[translation.locale] = {}
-            self.translations[translation.locale][translation.key] = translation
+            self._publish(updates)
 
     def get_translation(self, locale: str, key: str) -> Optional[Translation]:
-        locale_translations = self.translations.get(locale, {})
+        locale_translations = self.translations.get(locale)
+        if locale_translations is None:
+            return None
         return locale_translations.get(key)
 
     def load_json(self, locale: str, data: Dict[str, Any], prefix: str = "") -> int:
         """Load translations from JSON dict."""
+        accum: Dict[str, Translation] = {}
+        count = self._load_json_into(accum, locale, data, prefix)
+        self.add_translations(accum.values())
+        return count
+
+    def _load_json_into(
+        self,
+        accum: Dict[str, Translation],
+        locale: str,
+        data: Dict[str, Any],
+        prefix: str
+    ) -> int:
+        """Build translations from a JSON dict into accum."""
         count = 0
-        for key, value in data.items():
-            full_key = f"{prefix}.{key}" if prefix else key
-            
-            if isinstance(value, dict):
-                if "one" in value or "other" in value:
-                    # Plural forms
-                    trans = Translation(
+        # Explicit stack of (prefix, items iterator) keeps depth-first order
+        stack = [(prefix, iter(data.items()))]
+        while stack:
+            node_prefix, items = stack[-1]
+            for key, value in items:
+                full_key = f"{node_prefix}.{key}" if node_prefix else key
+                
+                if isinstance(value, dict):
+                    if PLURAL_ONE in value or PLURAL_OTHER in value:
+                        # Plural forms
+                        accum[full_key] = Translation(
+                            key=full_key,
+                            locale=locale,
+                            value=value.get(PLURAL_OTHER, ""),
+                            plural_forms=value
+                        )
+                        count += 1
+                    else:
+                        # Nested keys: descend, resume this level afterwards
+                        stack.append((full_key, iter(value.items())))
+                        break
+                else:
+                    accum[full_key] = Translation(
                         key=full_key,
                         locale=locale,
-                        value=value.get("other", ""),
-                        plural_forms=value
+                        value=str(value)
                     )
-                    self.add_translation(trans)
                     count += 1
-                else:
-                    # Nested keys
-                    count += self.load_json(locale, value, full_key)
             else:
-                trans = Translation(key=full_key, locale=locale, value=str(value))
-                self.add_translation(trans)
-                count += 1
+                stack.pop()
         
         return count
 
     def load_file(self, locale: str, file_path: str) -> int:
         """Load translations from JSON file."""
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(file_path, 'rb') as f:
+            raw = f.read()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
         return self.load_json(locale, data)
 
 
+# Format tokens, longest first so YYYY wins over YY
+_DATE_TOKEN = re.compile(r'YYYY|YY|MM|DD')
+_TIME_TOKEN = re.compile(r'HH|mm|ss')
+
+_DATE_FIELDS: Dict[str, Callable[[date], str]] = {
+    "YYYY": lambda value: str(value.year),
+    "YY": lambda value: str(value.year)[-2:],
+    "MM": lambda value: f"{value.month:02d}",
+    "DD": lambda value: f"{value.day:02d}",
+}
+
+_TIME_FIELDS: Dict[str, Callable[[datetime], str]] = {
+    "HH": lambda value: f"{value.hour:02d}",
+    "mm": lambda value: f"{value.minute:02d}",
+    "ss": lambda value: f"{value.second:02d}",
+}
+
+# A compiled format: (literal, None) or (token, getter) pairs in order
+FormatParts = Tuple[Tuple[str, Optional[Callable[[Any], str]]], ...]
+
+
+def _split_format(fmt: str, token: re.Pattern, fields: Dict[str, Callable]) -> FormatParts:
+    """Split a format string into literal and field parts."""
+    parts = []
+    pos = 0
+    for match in token.finditer(fmt):
+        if match.start() > pos:
+            parts.append((fmt[pos:match.start()], None))
+        parts.append((match.group(0), fields[match.group(0)]))
+        pos = match.end()
+    if pos < len(fmt):
+        parts.append((fmt[pos:], None))
+    return tuple(parts)
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_date_format(fmt: str) -> FormatParts:
+    return _split_format(fmt, _DATE_TOKEN, _DATE_FIELDS)
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_time_format(fmt: str) -> FormatParts:
+    return _split_format(fmt, _TIME_TOKEN, _TIME_FIELDS)
+
+
+def _render_format(parts: FormatParts, value: Any) -> str:
+    return "".join(getter(value) if getter else text for text, getter in parts)
+
+
 class Formatter:
     """Format values for locale."""
 
     def __init__(self, locale: Locale):
         self.locale = locale
+        self._date_parts = _compile_date_format(locale.date_format)
+        self._time_parts = _compile_time_format(locale.time_format)
+        # str.translate maps both separators in one pass, so swaps like de-DE's
+        # "." <-> "," need no intermediate placeholder
+        self._number_table = str.maketrans({
+            ",": locale.number_thousand,
+            ".": locale.number_decimal,
+        })
 
     def number(self, value: Union[int, float, Decimal], decimals: int = 2) -> str:
         """Format number for locale."""
         if isinstance(value, int):
-            formatted = f"{value:,}".replace(",", "THOUSAND")
+            formatted = f"{value:,}"
         else:
-            formatted = f"{value:,.{decimals}f}".replace(",", "THOUSAND")
-            formatted = formatted.replace(".", self.locale.number_decimal)
+            formatted = f"{value:,.{decimals}f}"
         
-        return formatted.replace("THOUSAND", self.locale.number_thousand)
+        return formatted.translate(self._number_table)
 
     def currency(self, value: Union[int, float, Decimal], symbol: Optional[str] = None) -> str:
         """Format currency for locale."""
@@ -213,81 +514,258 @@ class Formatter:
 
     def date(self, value: Union[date, datetime], format_str: Optional[str] = None) -> str:
         """Format date for locale."""
-        fmt = format_str or self.locale.date_format
-        
-        replacements = {
-            "YYYY": str(value.year),
-            "YY": str(value.year)[-2:],
-            "MM": f"{value.month:02d}",
-            "DD": f"{value.day:02d}",
-            "年": "年",
-            "月": "月",
-            "日": "日"
-        }
-        
-        result = fmt
-        for key, val in replacements.items():
-            result = result.replace(key, val)
-        
-        return result
+        parts = _compile_date_format(format_str) if format_str else self._date_parts
+        return _render_format(parts, value)
 
     def time(self, value: datetime, format_str: Optional[str] = None) -> str:
         """Format time for locale."""
-        fmt = format_str or self.locale.time_format
-        
-        replacements = {
-            "HH": f"{value.hour:02d}",
-            "mm": f"{value.minute:02d}",
-            "ss": f"{value.second:02d}"
-        }
-        
-        result = fmt
-        for key, val in replacements.items():
-            result = result.replace(key, val)
-        
-        return result
+        parts = _compile_time_format(format_str) if format_str else self._time_parts
+        return _render_format(parts, value)
 
     def percentage(self, value: float, decimals: int = 1) -> str:
         """Format percentage."""
         return f"{self.number(value * 100, decimals)}%"
 
 
+def _notify_after(method: Callable) -> Callable:
+    """Wrap a mutating container method to call self._on_change afterwards."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        self._on_change()
+        return result
+    return wrapper
+
+
+class _FallbackList(list):
+    """Fallbacks of one locale; in-place edits rebuild the lookup orders."""
+
+    __slots__ = ("_on_change",)
+
+    def __init__(self, fallbacks: Iterable[str], on_change: Callable[[], None]):
+        super().__init__(fallbacks)
+        self._on_change = on_change
+
+    __setitem__ = _notify_after(list.__setitem__)
+    __delitem__ = _notify_after(list.__delitem__)
+    __iadd__ = _notify_after(list.__iadd__)
+    __imul__ = _notify_after(list.__imul__)
+    append = _notify_after(list.append)
+    extend = _notify_after(list.extend)
+    insert = _notify_after(list.insert)
+    remove = _notify_after(list.remove)
+    pop = _notify_after(list.pop)
+    clear = _notify_after(list.clear)
+    sort = _notify_after(list.sort)
+    reverse = _notify_after(list.reverse)
+
+
+class _FallbackChain(dict):
+    """locale -> fallbacks mapping that rebuilds the lookup orders on edit."""
+
+    __slots__ = ("_on_change",)
+
+    def __init__(self, chain: Mapping[str, Iterable[str]], on_change: Callable[[], None]):
+        super().__init__(
+            (locale, _FallbackList(fallbacks, on_change)) for locale, fallbacks in chain.items()
+        )
+        self._on_change = on_change
+
+    def __setitem__(self, locale: str, fallbacks: Iterable[str]) -> None:
+        super().__setitem__(locale, _FallbackList(fallbacks, self._on_change))
+        self._on_change()
+
+    def update(self, *args, **kwargs) -> None:
+        for locale, fallbacks in dict(*args, **kwargs).items():
+            super().__setitem__(locale, _FallbackList(fallbacks, self._on_change))
+        self._on_change()
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def setdefault(self, locale: str, fallbacks: Iterable[str] = ()) -> List[str]:
+        if locale not in self:
+            self[locale] = fallbacks
+        return self[locale]
+
+    __delitem__ = _notify_after(dict.__delitem__)
+    pop = _notify_after(dict.pop)
+    popitem = _notify_after(dict.popitem)
+    clear = _notify_after(dict.clear)
+
+
 class Translator:
     """Main translation engine."""
 
     def __init__(self, store: TranslationStore, default_locale: str = "en-US"):
         self.store = store
-        self.default_locale = default_locale
-        self.fallback_chain: Dict[str, List[str]] = {
+        self._cache_generation = store.version
+        self._default_locale = default_locale
+        self._fallback_chain = _FallbackChain({
             "en-GB": ["en-US"],
             "es-MX": ["es-ES"],
             "fr-CA": ["fr-FR"],
             "pt-BR": ["pt-PT"],
             "zh-TW": ["zh-CN"]
+        }, self._rebuild_chains)
+        self._resolved_chain: Dict[str, Tuple[str, ...]] = {}
+        self._rebuild_chains()
+
+    @property
+    def default_locale(self) -> str:
+        return self._default_locale
+
+    @default_locale.setter
+    def default_locale(self, locale: str) -> None:
+        self._default_locale = locale
+        self._rebuild_chains()
+
+    @property
+    def fallback_chain(self) -> Dict[str, List[str]]:
+        """locale -> fallbacks; editing it in place updates lookups too."""
+        return self._fallback_chain
+
+    @fallback_chain.setter
+    def fallback_chain(self, chain: Mapping[str, Iterable[str]]) -> None:
+        self._fallback_chain = _FallbackChain(chain, self._rebuild_chains)
+        self._rebuild_chains()
+
+    def set_fallbacks(self, locale: str, fallbacks: Iterable[str]) -> None:
+        """Set the fallback locales tried after locale."""
+        self._fallback_chain[locale] = fallbacks
+
+    def _chain_for(self, locale: str) -> Tuple[str, ...]:
+        """Flatten locale, its fallbacks and the default into a lookup order."""
+        return tuple(dict.fromkeys(
+            [locale, *self._fallback_chain.get(locale, []), self._default_locale]
+        ))
+
+    def _rebuild_chains(self) -> None:
+        """Precompute lookup orders for known locales and drop memoized results."""
+        self._resolved_chain = {
+            loc: self._chain_for(loc)
+            for loc in {*self.store.locales, *self._fallback_chain}
         }
-        self._interpolation_pattern = re.compile(r'\{\{(\w+)\}\}')
+        self._reset_cache()
+
+    def _reset_cache(self) -> None:
+        """Start a fresh translate memo; swapping is O(1), unlike clearing."""
+        self._resolve_cached = _memoize(self._resolve_from_key, maxsize=16384)
 
-    def _get_plural_form(self, locale: str, count: int) -> PluralForm:
+    def _lazy_chain(self, locale: str) -> Tuple[str, ...]:
+        """Build the lookup order for a locale missing from _resolved_chain.
+
+        Only registered locales are memoized: arbitrary codes (say, from an
+        Accept-Language header) must not grow the table without bound.
+        """
+        chain = self._chain_for(locale)
+        if locale in self.store.locales:
+            self._resolved_chain[locale] = chain
+        return chain
+
+    def _get_plural_form(self, locale: str, count: int, plural_forms: Dict[str, str]) -> str:
         """Get plural form for count in locale."""
-        locale_obj = self.store.get_locale(locale)
-        if locale_obj and locale_obj.plural_rule:
+        locale_obj = self.store.locales.get(locale)
+        if locale_obj is not None and locale_obj.plural_rule is not None:
+            # A caller-supplied rule always has the last word
             return locale_obj.plural_rule(count)
-        
-        # Default English-like plural rules
-        if count == 0:
-            return PluralForm.ZERO
-        elif count == 1:
-            return PluralForm.ONE
-        else:
-            return PluralForm.OTHER
+        if count == 0 and PLURAL_ZERO in plural_forms:
+            # Built-in rules let an explicit zero form win for 0
+            return PLURAL_ZERO
+        if locale_obj is None:
+            # Translations loaded for an unregistered locale
+            return _plural_fn_for(locale)(count)
+        if locale_obj._plural_fn is None:
+            # Locale placed in store.locales without add_locale
+            return _plural_fn_for(locale_obj.code)(count)
+        return locale_obj._plural_fn(count)
+
+    def _interpolate(
+        self,
+        text: str,
+        template: Optional[str],
+        params: Optional[Dict[str, Any]]
+    ) -> str:
+        """Interpolate parameters into text, using its compiled template if any."""
+        if "{" not in text:
+            return text
+        if template is None:
+            if not params:
+                return text
+            return _PLACEHOLDER.sub(lambda m: str(params.get(m.group(1), m.group(0))), text)
+        return template.format_map(_SafeDict(params) if params else _SafeDict())
+
+    def _lookup(
+        self,
+        key: str,
+        locale: str,
+        count: Optional[int]
+    ) -> Optional[Tuple[str, Optional[str], bool]]:
+        """Find (text, template, plural) for a key, or None if no locale has it.
 
-    def _interpolate(self, text: str, params: Dict[str, Any]) -> str:
-        """Interpolate parameters into text."""
-        def replace(match):
-            key = match.group(1)
-            return str(params.get(key, match.group(0)))
-        
-        return self._interpolation_pattern.sub(replace, text)
+        plural tells whether a plural form was selected for count.
+        """
+        translations = self.store.translations
+
+        # Try locale and fallbacks
+        for try_locale in self._resolved_chain.get(locale) or self._lazy_chain(locale):
+            locale_translations = translations.get(try_locale)
+            if locale_translations is None:
+                continue
+            translation = locale_translations.get(key)
+            if translation is not None:
+                # Handle plurals
+                if count is not None and translation.plural_forms:
+                    plural_forms = translation.plural_forms
+                    plural_form = self._get_plural_form(try_locale, count, plural_forms)
+                    if plural_form not in plural_forms:
+                        plural_form = PLURAL_OTHER
+                    if plural_form in plural_forms:
+                        return (
+                            plural_forms[plural_form],
+                            translation._plural_templates.get(plural_form),
+                            True
+                        )
+                    return translation.value, translation._template, True
+                return translation.value, translation._template, False
+
+        return None
+
+    def _resolve(
+        self,
+        key: str,
+        locale: str,
+        params: Optional[Dict[str, Any]],
+        count: Optional[int]
+    ) -> Optional[str]:
+        """Resolve a key to its final text, or None if no locale has it.
+
+        params is never mutated; the plural path injects count into a copy.
+        """
+        found = self._lookup(key, locale, count)
+        if found is None:
+            return None
+        text, template, plural = found
+        if plural:
+            params = {**params, "count": count} if params else {"count": count}
+        return self._interpolate(text, template, params)
+
+    def _resolve_from_key(
+        self,
+        key: str,
+        locale: str,
+        params_key: Optional[tuple],
+        count: Optional[int],
+        generation: int
+    ) -> Optional[str]:
+        """Memoized entry point; params arrive as a hashable sorted tuple.
+
+        generation is the store version read before the lookup. It is only
+        part of the memo key, so a result computed against an older store can
+        never be served once the version has moved on.
+        """
+        return self._resolve(key, locale, dict(params_key) if params_key else None, count)
 
     def translate(
         self,
@@ -299,32 +777,78 @@ class Translator:
     ) -> str:
         """Translate a key."""
         locale = locale or self.default_locale
-        params = params or {}
 
-        # Try locale and fallbacks
-        locales_to_try = [locale] + self.fallback_chain.get(locale, []) + [self.default_locale]
-        
-        for try_locale in locales_to_try:
-            translation = self.store.get_translation(try_locale, key)
-            if translation:
-                # Handle plurals
-                if count is not None and translation.plural_forms:
-                    plural_form = self._get_plural_form(try_locale, count)
-                    text = translation.plural_forms.get(
-                        plural_form.value,
-                        translation.plural_forms.get("other", translation.value)
-                    )
-                    params["count"] = count
-                else:
-                    text = translation.value
-                
-                return self._interpolate(text, params)
+        # Entries from older store versions can no longer match; drop them
+        generation = self.store.version
+        if generation != self._cache_generation:
+            self._cache_generation = generation
+            self._reset_cache()
+
+        if (params and not _is_cacheable(params)) or (count is not None and type(count) is not int):
+            text = self._resolve(key, locale, params, count)
+        else:
+            params_key = tuple(sorted(params.items())) if params else None
+            text = self._resolve_cached(key, locale, params_key, count, generation)
+
+        if text is not None:
+            return text
 
         # Return default or key
         return default if default is not None else key
 
+    def translate_batch(
+        self,
+        key: str,
+        params_list: List[Optional[Dict[str, Any]]],
+        locale: Optional[str] = None,
+        default: Optional[str] = None
+    ) -> List[str]:
+        """Translate one key against many param dicts.
+
+        The template is looked up once; plain {name} templates are then
+        rendered from pre-split parts without going through format_map.
+        A None or empty entry means no params, as in translate.
+        """
+        found = self._lookup(key, locale or self.default_locale, None)
+        if found is None:
+            text = default if default is not None else key
+            return [text] * len(params_list)
+        text, template, _ = found
+        if "{" not in text:
+            return [text] * len(params_list)
+
+        parts = _split_template(template) if template is not None else None
+        if parts is None:
+            return [self._interpolate(text, template, params) for params in params_list]
+
+        results = []
+        for params in params_list:
+            if not params:
+                params = {}
+            out = []
+            for literal, name in parts:
+                out.append(literal)
+                if name is not None:
+                    out.append(str(params[name]) if name in params else "{{" + name + "}}")
+            results.append("".join(out))
+        return results
+
+    def translate_simple(self, key: str, locale: Optional[str] = None) -> str:
+        """Translate a key with no params, count or default.
+
+        Static strings present in the requested locale are returned straight
+        from the store; anything else goes through translate.
+        """
+        locale_translations = self.store.translations.get(locale or self.default_locale)
+        translation = locale_translations.get(key) if locale_translations else None
+        if translation is not None and "{" not in translation.value:
+            return translation.value
+        return self.translate(key, locale=locale)
+
     def t(self, key: str, **kwargs) -> str:
         """Shorthand for translate."""
+        if not kwargs:
+            return self.translate_simple(key)
         return self.translate(key, **kwargs)
 
     def has_translation(self, key: str, locale: Optional[str] = None) -> bool:
@@ -333,39 +857,84 @@ class Translator:
         return self.store.get_translation(locale, key) is not None
 
 
+# Current locale per LocaleManager id, per thread and per asyncio task. One
+# module-level variable, since every Context keeps each ContextVar it has
+# seen alive; the mapping is replaced, never mutated.
+_current_locales: ContextVar[Mapping[int, str]] = ContextVar(
+    "roadlocalize_current_locales", default=MappingProxyType({})
+)
+_manager_ids = itertools.count()
+
+
 class LocaleManager:
     """Manage locale preferences."""
 
     def __init__(self, translator: Translator):
         self.translator = translator
-        self._current_locale = threading.local()
-        self._formatters: Dict[str, Formatter] = {}
+        self._id = next(_manager_ids)  # never reused, unlike id(self)
+        # Read-only view shared by all threads; replaced wholesale on insert
+        self._formatters: Mapping[str, Formatter] = MappingProxyType({})
+        self._locales_version = -1
+        self._build_formatters()
 
     @property
     def current(self) -> str:
         """Get current locale."""
-        return getattr(self._current_locale, 'value', self.translator.default_locale)
+        return _current_locales.get().get(self._id) or self.translator.default_locale
 
     @current.setter
     def current(self, locale: str) -> None:
         """Set current locale."""
-        self._current_locale.value = locale
+        self.set_current(locale)
+
+    def set_current(self, locale: str) -> Token:
+        """Set current locale, returning a token for reset_current."""
+        return _current_locales.set({**_current_locales.get(), self._id: locale})
+
+    def reset_current(self, token: Token) -> None:
+        """Restore the locale that was current before set_current.
+
+        Only this manager's entry is restored, so other managers' changes
+        made since set_current are kept.
+        """
+        previous = token.old_value
+        locales = dict(_current_locales.get())
+        if previous is Token.MISSING or self._id not in previous:
+            locales.pop(self._id, None)
+        else:
+            locales[self._id] = previous[self._id]
+        _current_locales.set(locales)
 
     def get_formatter(self, locale: Optional[str] = None) -> Formatter:
         """Get formatter for locale."""
         locale = locale or self.current
-        if locale not in self._formatters:
-            locale_obj = self.translator.store.get_locale(locale)
-            if locale_obj:
-                self._formatters[locale] = Formatter(locale_obj)
-            else:
-                # Fallback to default
-                locale_obj = self.translator.store.get_locale(self.translator.default_locale)
-                self._formatters[locale] = Formatter(locale_obj)
-        return self._formatters[locale]
+        if self._locales_version != self.translator.store.locales_version:
+            self._build_formatters()
+        return self._formatters.get(locale) or self._make_and_cache(locale)
+
+    def _build_formatters(self) -> None:
+        """Create a formatter per registered locale, replacing stale ones."""
+        store = self.translator.store
+        self._locales_version = store.locales_version
+        self._formatters = MappingProxyType({
+            code: Formatter(locale_obj)
+            for code, locale_obj in store.locales.items()
+        })
+
+    def _make_and_cache(self, locale: str) -> Formatter:
+        """Create a formatter for a locale registered after startup."""
+        locale_obj = self.translator.store.get_locale(locale)
+        if not locale_obj:
+            # Fallback to default
+            locale_obj = self.translator.store.get_locale(self.translator.default_locale)
+        formatter = Formatter(locale_obj)
+        self._formatters = MappingProxyType({**self._formatters, locale: formatter})
+        return formatter
 
     def t(self, key: str, **kwargs) -> str:
         """Translate using current locale."""
+        if not kwargs:
+            return self.translator.translate_simple(key, self.current)
         return self.translator.translate(key, locale=self.current, **kwargs)
 
     def format_number(self, value: Union[int, float], **kwargs) -> str:
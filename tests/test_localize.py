@@ -0,0 +1,459 @@
+"""Tests for roadlocalize.localize."""
+
+import asyncio
+import json
+import sys
+import tempfile
+import threading
+import unittest
+from datetime import date, datetime
+from decimal import Decimal
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from roadlocalize import localize  # noqa: E402
+from roadlocalize.localize import I18n, Locale, Translation  # noqa: E402
+
+
+class TranslateCacheTest(unittest.TestCase):
+    """The translate memo must never change what translate returns."""
+
+    def setUp(self):
+        self.i18n = I18n()
+        self.i18n.load_translations("en-US", {"value": "v={{v}}"})
+        self.translator = self.i18n.translator
+
+    def render(self, value):
+        return self.translator.translate("value", params={"v": value})
+
+    def test_equal_values_of_different_types_render_separately(self):
+        self.assertEqual(self.render(1), "v=1")
+        self.assertEqual(self.render(1.0), "v=1.0")
+        self.assertEqual(self.render(True), "v=True")
+        self.assertEqual(self.render(1), "v=1")
+
+    def test_unhashable_params_bypass_cache(self):
+        self.assertEqual(self.render([1]), "v=[1]")
+
+    def test_repeated_calls_hit_cache(self):
+        self.render("a")
+        self.render("a")
+        self.assertEqual(self.translator._resolve_cached.cache_info().hits, 1)
+
+    def test_store_writes_invalidate_cached_results(self):
+        self.assertEqual(self.render("a"), "v=a")
+        self.i18n.load_translations("en-US", {"value": "w={{v}}"})
+        self.assertEqual(self.render("a"), "w=a")
+
+    def test_result_from_older_store_version_is_not_served(self):
+        # A translate that read the old version finishes after another thread
+        # already moved the memo to the new version
+        store = self.i18n.store
+        old_generation = store.version
+        old_translations = {locale: dict(entries) for locale, entries in store.translations.items()}
+        self.i18n.load_translations("en-US", {"value": "w={{v}}"})
+        self.render("warm")
+        new_translations, store.translations = store.translations, old_translations
+        self.translator._resolve_cached("value", "en-US", (("v", "a"),), None, old_generation)
+        store.translations = new_translations
+        self.assertEqual(self.render("a"), "w=a")
+
+    def test_default_locale_change_invalidates_cached_results(self):
+        self.i18n.load_translations("es-ES", {"value": "es={{v}}"})
+        self.assertEqual(self.render("a"), "v=a")
+        self.translator.default_locale = "es-ES"
+        self.assertEqual(self.render("a"), "es=a")
+
+
+class InterpolationTest(unittest.TestCase):
+    """Placeholders render like the original regex interpolation."""
+
+    def setUp(self):
+        self.i18n = I18n()
+        self.store = self.i18n.store
+        self.translator = self.i18n.translator
+
+    def add(self, value, key="k"):
+        self.store.add_translation(Translation(key=key, locale="en-US", value=value))
+
+    def test_add_translation_keeps_double_brace_placeholders(self):
+        self.add("Hello {{name}}")
+        self.assertEqual(self.translator.translate("k", params={"name": "A"}), "Hello A")
+        self.assertEqual(self.store.get_translation("en-US", "k").value, "Hello {{name}}")
+
+    def test_load_json_keeps_raw_values(self):
+        self.i18n.load_translations("en-US", {"k": "Hi {{name}}", "p": {"one": "{{count}} x"}})
+        self.assertEqual(self.store.get_translation("en-US", "k").value, "Hi {{name}}")
+        self.assertEqual(self.store.get_translation("en-US", "p").plural_forms, {"one": "{{count}} x"})
+
+    def test_literal_braces_render_unchanged(self):
+        for value in ("Use {braces}", "a { b", "x {0} y", "}{", "a}b", "5}", "{{{name}}}"):
+            self.add(value)
+            self.assertEqual(self.translator.translate("k"), value)
+        self.assertEqual(self.translator.translate("k", params={"name": "A"}), "{A}")
+
+    def test_translate_simple_returns_raw_value(self):
+        for value in ("Price: 5}", "a}b", "plain"):
+            self.add(value)
+            self.assertEqual(self.translator.translate_simple("k"), value)
+
+    def test_lone_closing_brace_in_plural_form(self):
+        self.i18n.load_translations("en-US", {"p": {"one": "1 }", "other": "{{count}} }"}})
+        self.assertEqual(self.translator.translate("p", count=1), "1 }")
+        self.assertEqual(self.translator.translate("p", count=2), "2 }")
+
+    def test_missing_params_keep_placeholder(self):
+        self.add("Hi {{name}} {{other}}")
+        self.assertEqual(self.translator.translate("k", params={"name": "A"}), "Hi A {{other}}")
+
+    def test_non_identifier_placeholders(self):
+        self.add("{{0}} of {{1abc}} {{name}}")
+        self.assertEqual(
+            self.translator.translate("k", params={"0": "a", "1abc": "b", "name": "c"}),
+            "a of b c"
+        )
+        self.assertEqual(self.translator.translate("k"), "{{0}} of {{1abc}} {{name}}")
+
+
+class FallbackChainTest(unittest.TestCase):
+
+    def setUp(self):
+        self.i18n = I18n()
+        self.i18n.load_translations("en-US", {"greeting": "hi"})
+        self.i18n.load_translations("es-ES", {"greeting": "hola"})
+        self.translator = self.i18n.translator
+
+    def test_assigning_into_fallback_chain_applies(self):
+        self.assertEqual(self.translator.translate("greeting", locale="es-AR"), "hi")
+        self.translator.fallback_chain["es-AR"] = ["es-ES"]
+        self.assertEqual(self.translator.translate("greeting", locale="es-AR"), "hola")
+        del self.translator.fallback_chain["es-AR"]
+        self.assertEqual(self.translator.translate("greeting", locale="es-AR"), "hi")
+
+    def test_appending_to_fallbacks_applies(self):
+        self.i18n.load_translations("fr-FR", {"greeting": "salut"})
+        self.translator.fallback_chain.setdefault("fr-CA", []).append("es-ES")
+        self.assertEqual(self.translator.fallback_chain["fr-CA"], ["fr-FR", "es-ES"])
+        self.translator.fallback_chain["fr-CA"].remove("fr-FR")
+        self.assertEqual(self.translator.translate("greeting", locale="fr-CA"), "hola")
+
+    def test_set_fallbacks_applies_after_lookup(self):
+        self.assertEqual(self.translator.translate("greeting", locale="es-AR"), "hi")
+        self.translator.set_fallbacks("es-AR", ["es-ES"])
+        self.assertEqual(self.translator.translate("greeting", locale="es-AR"), "hola")
+
+    def test_reassigning_fallback_chain_applies(self):
+        self.translator.fallback_chain = {"es-AR": ["es-ES"]}
+        self.assertEqual(self.translator.translate("greeting", locale="es-AR"), "hola")
+        self.assertEqual(self.translator.fallback_chain["es-AR"], ["es-ES"])
+
+    def test_unregistered_locales_are_not_memoized(self):
+        size = len(self.translator._resolved_chain)
+        for n in range(100):
+            self.translator.translate("greeting", locale=f"x-{n}")
+        self.assertEqual(len(self.translator._resolved_chain), size)
+
+
+class FormatterTest(unittest.TestCase):
+
+    def test_reregistered_locale_replaces_formatter(self):
+        i18n = I18n()
+        self.assertEqual(i18n.format(date(2024, 1, 2)), "2024-01-02")
+        i18n.store.add_locale(Locale(
+            code="en-US",
+            name="English (US)",
+            native_name="English",
+            date_format="MM/DD/YYYY"
+        ))
+        self.assertEqual(i18n.format(date(2024, 1, 2)), "01/02/2024")
+
+    def test_locale_registered_later_gets_formatter(self):
+        i18n = I18n()
+        i18n.store.add_locale(Locale(
+            code="it-IT",
+            name="Italian",
+            native_name="Italiano",
+            number_decimal=",",
+            number_thousand="."
+        ))
+        i18n.set_locale("it-IT")
+        self.assertEqual(i18n.format(1234.5), "1.234,50")
+
+    def test_formatters_are_read_only_and_rebuilt_on_insert(self):
+        manager = I18n().locale_manager
+        formatter = manager.get_formatter("it-IT")  # unknown: built from the default
+        snapshot = manager._formatters
+        with self.assertRaises(TypeError):
+            snapshot["it-IT"] = None
+        manager.translator.store.add_locale(Locale(code="it-IT", name="Italian", native_name="Italiano"))
+        rebuilt = manager.get_formatter("it-IT")
+        self.assertIsNot(rebuilt, formatter)
+        self.assertEqual(rebuilt.locale.code, "it-IT")
+        self.assertIs(snapshot["it-IT"], formatter)
+        self.assertIs(manager.get_formatter("it-IT"), rebuilt)
+
+    def test_number_swaps_separators(self):
+        manager = I18n().locale_manager
+        cases = {
+            "de-DE": ("1.234.567,89", "1.234.567", "-1.234,5", "1.234,50 €"),
+            "fr-FR": ("1 234 567,89", "1 234 567", "-1 234,5", "1 234,50 €"),
+            "en-US": ("1,234,567.89", "1,234,567", "-1,234.5", "$1,234.50"),
+        }
+        for code, (floating, integer, negative, currency) in cases.items():
+            formatter = manager.get_formatter(code)
+            self.assertEqual(formatter.number(1234567.891), floating)
+            self.assertEqual(formatter.number(1234567), integer)
+            self.assertEqual(formatter.number(-1234.5, 1), negative)
+            self.assertEqual(formatter.number(Decimal("1234.5")), currency.strip("$ €"))
+            self.assertEqual(formatter.currency(1234.5), currency)
+
+    def test_custom_date_format(self):
+        formatter = I18n().locale_manager.get_formatter("en-US")
+        self.assertEqual(formatter.date(date(2005, 3, 7), "DD/MM/YY"), "07/03/05")
+        self.assertEqual(formatter.date(date(2024, 1, 2), "YYYY.MM.DD YY"), "2024.01.02 24")
+        self.assertEqual(formatter.date(date(2024, 11, 22), "D MMM"), "D 11M")
+
+    def test_custom_time_format(self):
+        formatter = I18n().locale_manager.get_formatter("en-US")
+        value = datetime(2024, 1, 2, 13, 4, 5)
+        self.assertEqual(formatter.time(value), "13:04:05")
+        self.assertEqual(formatter.time(value, "HH:mm"), "13:04")
+        self.assertEqual(formatter.time(value, "mm'ss"), "04'05")
+
+    def test_locale_date_format_with_literals(self):
+        formatter = I18n().locale_manager.get_formatter("ja-JP")
+        self.assertEqual(formatter.date(date(2024, 1, 2)), "2024年01月02日")
+
+
+class CurrentLocaleTest(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = I18n().locale_manager
+
+    def test_set_and_reset_current(self):
+        outer = self.manager.set_current("fr-FR")
+        inner = self.manager.set_current("de-DE")
+        self.assertEqual(self.manager.current, "de-DE")
+        self.manager.reset_current(inner)
+        self.assertEqual(self.manager.current, "fr-FR")
+        self.manager.reset_current(outer)
+        self.assertEqual(self.manager.current, "en-US")
+
+    def test_managers_are_independent(self):
+        other = I18n().locale_manager
+        token = self.manager.set_current("fr-FR")
+        other.current = "de-DE"
+        self.manager.reset_current(token)
+        self.assertEqual(self.manager.current, "en-US")
+        self.assertEqual(other.current, "de-DE")
+
+    def test_threads_do_not_share_current(self):
+        self.manager.current = "fr-FR"
+        seen = []
+
+        def worker():
+            seen.append(self.manager.current)
+            self.manager.current = "de-DE"
+            seen.append(self.manager.current)
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+        self.assertEqual(seen, ["en-US", "de-DE"])
+        self.assertEqual(self.manager.current, "fr-FR")
+
+    def test_tasks_do_not_share_current(self):
+        async def request(locale):
+            self.manager.current = locale
+            await asyncio.sleep(0)
+            return self.manager.current
+
+        async def main():
+            return await asyncio.gather(request("fr-FR"), request("de-DE"))
+
+        self.assertEqual(asyncio.run(main()), ["fr-FR", "de-DE"])
+        self.assertEqual(self.manager.current, "en-US")
+
+
+class TranslationStoreTest(unittest.TestCase):
+
+    def test_registered_locales_start_with_empty_dicts(self):
+        store = I18n().store
+        self.assertEqual(store.translations["en-US"], {})
+        store.add_locale(Locale(code="it-IT", name="Italian", native_name="Italiano"))
+        self.assertEqual(store.translations["it-IT"], {})
+
+    def test_add_translation_copies_only_its_locale(self):
+        i18n = I18n()
+        i18n.load_translations("en-US", {"a": "A", "b": "B"})
+        en_before = i18n.store.translations["en-US"]
+        i18n.store.add_translation(Translation(key="a", locale="fr-FR", value="Af"))
+        self.assertIs(i18n.store.translations["en-US"], en_before)
+        self.assertEqual(i18n.store.get_translation("fr-FR", "a").value, "Af")
+
+    def test_add_translation_updates_known_locale_in_place(self):
+        i18n = I18n()
+        i18n.load_translations("en-US", {"a": "A"})
+        translations, en = i18n.store.translations, i18n.store.translations["en-US"]
+        i18n.store.add_translation(Translation(key="b", locale="en-US", value="B"))
+        self.assertIs(i18n.store.translations, translations)
+        self.assertIs(i18n.store.translations["en-US"], en)
+        self.assertEqual(i18n.translator.translate("b"), "B")
+
+    def test_locales_and_keys_are_interned_on_insert(self):
+        store = I18n().store
+        key, locale = "".join(["app.", "title"]), "".join(["en-", "US"])
+        store.add_translation(Translation(key=key, locale=locale, value="T"))
+        store.load_json("".join(["fr-", "FR"]), {"app": {"title": "T"}})
+        for code in ("en-US", "fr-FR"):
+            translation = store.get_translation(code, "app.title")
+            self.assertIs(translation.key, sys.intern("app.title"))
+            self.assertIs(translation.locale, sys.intern(code))
+            stored_key = next(k for k in store.translations[code] if k == "app.title")
+            self.assertIs(stored_key, sys.intern("app.title"))
+
+    def test_load_json_keeps_depth_first_key_order(self):
+        store = I18n().store
+        count = store.load_json("en-US", {
+            "a": "1",
+            "b": {"c": "2", "d": {"e": "3"}, "f": "4"},
+            "g": {"one": "x", "other": "y"},
+            "h": "5"
+        })
+        self.assertEqual(count, 6)
+        self.assertEqual(list(store.translations["en-US"]), ["a", "b.c", "b.d.e", "b.f", "g", "h"])
+
+    def test_load_json_handles_nesting_deeper_than_recursion_limit(self):
+        depth = sys.getrecursionlimit() + 100
+        data = leaf = {}
+        for _ in range(depth):
+            leaf["n"] = {}
+            leaf = leaf["n"]
+        leaf["k"] = "deep"
+        store = I18n().store
+        self.assertEqual(store.load_json("en-US", data), 1)
+        key = ".".join(["n"] * depth + ["k"])
+        self.assertEqual(store.get_translation("en-US", key).value, "deep")
+
+    def load_file(self):
+        data = {"nav": {"home": "Início"}, "items": {"one": "{{count}} item", "other": "{{count}} itens"}}
+        handle = tempfile.NamedTemporaryFile("w", suffix=".json", encoding="utf-8", delete=False)
+        with handle:
+            json.dump(data, handle, ensure_ascii=False)
+        self.addCleanup(Path(handle.name).unlink)
+        i18n = I18n()
+        self.assertEqual(i18n.load_file("pt-PT", handle.name), 2)
+        self.assertEqual(i18n.translator.translate("nav.home", locale="pt-PT"), "Início")
+        self.assertEqual(i18n.translator.translate("items", locale="pt-PT", count=2), "2 itens")
+
+    @unittest.skipIf(localize.orjson is None, "orjson not installed")
+    def test_load_file_with_orjson(self):
+        self.load_file()
+
+    def test_load_file_with_json(self):
+        with mock.patch.object(localize, "orjson", None):
+            self.load_file()
+
+    def test_add_translations_publishes_all_locales(self):
+        i18n = I18n()
+        i18n.store.add_translations([
+            Translation(key="a", locale="en-US", value="A"),
+            Translation(key="a", locale="es-ES", value="Ae"),
+        ])
+        self.assertEqual(i18n.translator.translate("a", locale="es-ES"), "Ae")
+        self.assertEqual(i18n.translator.translate("a"), "A")
+
+
+class PluralTest(unittest.TestCase):
+
+    def setUp(self):
+        self.i18n = I18n()
+        self.forms = {"zero": "none", "one": "one", "few": "few", "other": "many"}
+
+    def test_zero_form_wins_with_builtin_rules(self):
+        self.i18n.load_translations("en-US", {"n": self.forms})
+        self.assertEqual(self.i18n.translator.translate("n", count=0), "none")
+        self.assertEqual(self.i18n.translator.translate("n", count=1), "one")
+
+    def test_builtin_rule_without_zero_form(self):
+        self.i18n.load_translations("fr-FR", {"n": {"one": "one", "other": "many"}})
+        self.assertEqual(self.i18n.translator.translate("n", locale="fr-FR", count=0), "one")
+
+    def test_generated_cldr_rules(self):
+        forms = {form: form for form in ("zero", "one", "two", "few", "many", "other")}
+        expected = {
+            "ru-RU": {1: "one", 2: "few", 5: "many", 11: "many", 21: "one", 22: "few"},
+            "uk-UA": {1: "one", 2: "few", 5: "many", 11: "many", 21: "one", 22: "few"},
+            "pl-PL": {1: "one", 2: "few", 5: "many", 11: "many", 21: "many", 22: "few"},
+            "ar-SA": {0: "zero", 1: "one", 2: "two", 3: "few", 11: "many", 100: "other"},
+        }
+        for code, categories in expected.items():
+            self.i18n.load_translations(code, {"n": forms})
+            for count, category in categories.items():
+                with self.subTest(locale=code, count=count):
+                    self.assertEqual(self.i18n.translator.translate("n", locale=code, count=count), category)
+
+    def test_plural_lookup_leaves_caller_params_alone(self):
+        self.i18n.load_translations("en-US", {"n": {"one": "{{count}} {{thing}}", "other": "{{count}} {{thing}}s"}})
+        params = {"thing": "file"}
+        self.assertEqual(self.i18n.translator.translate("n", params=params, count=3), "3 files")
+        self.assertEqual(self.i18n.t("n", params=params, count=1), "1 file")
+        self.assertEqual(params, {"thing": "file"})
+
+    def test_custom_rule_decides_zero(self):
+        self.i18n.store.add_locale(Locale(
+            code="xx-XX",
+            name="X",
+            native_name="X",
+            plural_rule=lambda n: "few" if n == 0 else "other"
+        ))
+        self.i18n.load_translations("xx-XX", {"n": self.forms})
+        self.assertEqual(self.i18n.translator.translate("n", locale="xx-XX", count=0), "few")
+
+    def test_locale_added_without_add_locale(self):
+        self.i18n.store.locales["zz-ZZ"] = Locale(code="zz-ZZ", name="Z", native_name="Z")
+        self.i18n.load_translations("zz-ZZ", {"n": {"one": "one", "other": "many"}})
+        self.assertEqual(self.i18n.translator.translate("n", locale="zz-ZZ", count=3), "many")
+
+    def test_plural_rule_assigned_after_registration(self):
+        self.i18n.load_translations("en-US", {"n": {"one": "one", "other": "many"}})
+        self.i18n.store.locales["en-US"].plural_rule = lambda n: "other"
+        self.i18n.load_translations("en-US", {"unrelated": "x"})  # new store version
+        self.assertEqual(self.i18n.translator.translate("n", count=1), "many")
+
+
+class TranslateBatchTest(unittest.TestCase):
+
+    def setUp(self):
+        self.i18n = I18n()
+        self.i18n.load_translations("en-US", {
+            "hi": "Hi {{name}}",
+            "msgs": "{{count}} msgs",
+            "raw": "{{0}} {{name}}",
+            "price": "Price: 5}"
+        })
+        self.translator = self.i18n.translator
+
+    def test_matches_translate(self):
+        rows = [{"name": "A"}, {"name": 1}, {}, None]
+        expected = [self.translator.translate("hi", params=row) for row in rows]
+        self.assertEqual(self.translator.translate_batch("hi", rows), expected)
+        self.assertEqual(expected[2:], ["Hi {{name}}", "Hi {{name}}"])
+
+    def test_regex_fallback_accepts_missing_params(self):
+        self.assertEqual(
+            self.translator.translate_batch("raw", [None, {"0": "a", "name": "b"}]),
+            ["{{0}} {{name}}", "a b"]
+        )
+
+    def test_static_text_with_closing_brace(self):
+        self.assertEqual(self.translator.translate_batch("price", [None, {"a": 1}]), ["Price: 5}"] * 2)
+
+    def test_count_only_fills_plural_translations(self):
+        self.assertEqual(self.translator.translate("msgs", count=3), "{{count}} msgs")
+
+
+if __name__ == "__main__":
+    unittest.main()